@@ -1,8 +1,8 @@
 import streamlit as st
 import pandas as pd
+import numpy as np
 import io
-import tempfile
-import os
+import hashlib
 import logging
 from typing import Dict, List, Optional
 import json
@@ -30,7 +30,39 @@ except ImportError:
     IMPORTS_AVAILABLE = False
     st.error("Required modules not found. Please ensure all dependencies are installed.")
 
-def create_sample_csv():
+# PyArrow's multithreaded CSV reader is used when installed (it ships with Streamlit)
+try:
+    import pyarrow as pa
+    from pyarrow import csv as pacsv
+    PYARROW_AVAILABLE = True
+except ImportError:
+    PYARROW_AVAILABLE = False
+
+# Report sections with their own widgets run as fragments so those widgets only
+# rerun that section (sections without widgets gain nothing from it)
+# (st.fragment on Streamlit >= 1.37, st.experimental_fragment on 1.33-1.36)
+fragment = getattr(st, 'fragment', None) or getattr(st, 'experimental_fragment', None) or (lambda func: func)
+
+# Columns the feedback agent reads from the uploaded CSV
+REQUIRED_COLUMNS = ('student_id', 'teacher_id', 'objective', 'question', 'answer')
+REQUIRED_SET = frozenset(REQUIRED_COLUMNS)
+
+# Scores are kept as float64: float32 rounds ties such as 0.505 differently on display
+SCORE_DTYPE = np.float64
+
+# Block size for the pyarrow CSV reader; larger blocks mean fewer, bigger parallel chunks
+CSV_BLOCK_SIZE = 8 * 1024 * 1024
+
+# Number of student expanders rendered per page in the detailed view
+STUDENTS_PER_PAGE = 25
+
+# Bounds on the per-upload caches; every re-upload gets a new file id, so without
+# them each one would keep another parsed frame and feedback summary alive
+UPLOAD_CACHE_MAX_ENTRIES = 8
+UPLOAD_CACHE_TTL_SECONDS = 60 * 60
+
+@st.cache_data
+def create_sample_csv() -> str:
     """Create a sample CSV for download"""
     sample_data = '''"student_id","teacher_id","objective","question","answer"
 "student_001","teacher_001","Understand AI concepts","What is the primary role of ECU diagnostics in vehicles?","ECU diagnostics monitor vehicle systems to detect faults and ensure performance."
@@ -38,34 +70,144 @@ def create_sample_csv():
 "student_003","teacher_003","Analyze AI applications","What advantages does AI bring to AUTOSAR-based fault detection?","AI analyzes AUTOSAR data to predict faults with higher accuracy using real-time ECU inputs."'''
     return sample_data
 
+@st.cache_data
+def create_sample_df() -> pd.DataFrame:
+    """Parse the sample CSV once for the instructions preview"""
+    return pd.read_csv(io.StringIO(create_sample_csv()))
+
+def _skip_bad_line(row, skipped_rows):
+    """Log, record and skip a malformed CSV row (wrong number of fields)"""
+    # The multithreaded reader does not track line numbers (row.number is None)
+    location = f" {row.number}" if row.number is not None else ""
+    logger.warning(f"Skipping malformed CSV line{location}: {row.text}")
+    skipped_rows.append(row.text)
+    return 'skip'
+
+def _warn_extra_columns(columns):
+    """Warn about header columns that parse_csv drops before validation"""
+    # Extra columns might indicate CSV parsing issues; a pandas-exported index column
+    # is named 'Unnamed: 0' by pandas but left blank by pyarrow, so skip both
+    extra_columns = [
+        col for col in columns
+        if col not in REQUIRED_SET and col.strip() and not col.startswith('Unnamed')
+    ]
+    if extra_columns:
+        st.warning(f"Found additional columns that will be ignored: {', '.join(extra_columns)}")
+
+@st.cache_data(show_spinner=False, max_entries=UPLOAD_CACHE_MAX_ENTRIES, ttl=UPLOAD_CACHE_TTL_SECONDS)
+def parse_csv(file_key: str, _file_bytes: bytes) -> pd.DataFrame:
+    """Parse the uploaded CSV bytes into a DataFrame (cached on the upload's key, not its bytes)"""
+    if PYARROW_AVAILABLE:
+        skipped_rows = []
+        table = pacsv.read_csv(
+            io.BytesIO(_file_bytes),
+            read_options=pacsv.ReadOptions(use_threads=True, block_size=CSV_BLOCK_SIZE, encoding='utf-8'),
+            parse_options=pacsv.ParseOptions(invalid_row_handler=lambda row: _skip_bad_line(row, skipped_rows)),
+            convert_options=pacsv.ConvertOptions(
+                column_types={col: pa.string() for col in REQUIRED_COLUMNS},
+                strings_can_be_null=True  # Empty cells count as missing, as with pandas
+            )
+        )
+        # Missing required columns must still reach validate_csv_format, so only
+        # drop the extra ones here instead of passing include_columns
+        _warn_extra_columns(table.column_names)
+        table = table.select([col for col in table.column_names if col in REQUIRED_SET])
+        df = table.to_pandas(types_mapper=pd.ArrowDtype)
+        # pyarrow drops rows with too few fields too (pandas pads them with NaN), so
+        # record the count on the frame for validate_csv_format to reject
+        df.attrs['skipped_rows'] = len(skipped_rows)
+        return df
+    
+    # usecols hides the extra columns, so read just the header to report them
+    _warn_extra_columns(pd.read_csv(io.BytesIO(_file_bytes), nrows=0, encoding='utf-8').columns)
+    return pd.read_csv(
+        io.BytesIO(_file_bytes),
+        usecols=lambda col: col in REQUIRED_SET,  # Drop columns the agent never reads
+        dtype=str,  # All required columns are text; skip type inference
+        engine='c',
+        low_memory=False,
+        cache_dates=False,
+        encoding='utf-8',
+        quotechar='"',
+        on_bad_lines='warn'  # This will warn about bad lines but continue processing
+    )
+
+@st.cache_resource
+def get_llm_and_storage():
+    """Build the config, profile storage and LLM client once per process"""
+    config = get_config()
+    profile_storage = ProfileStorage(db_path=config.PROFILE_DB_PATH)
+    llm = ConfigurableLLM(
+        config=config,
+        api_key=config.GROQ_API_KEY,
+        model=config.LLM_MODEL,
+        base_url=config.LLM_BASE_URL,
+        max_tokens=config.MAX_TOKENS
+    )
+    return config, profile_storage, llm
+
+@st.cache_data(show_spinner=False, max_entries=UPLOAD_CACHE_MAX_ENTRIES, ttl=UPLOAD_CACHE_TTL_SECONDS)
+def run_feedback(file_key: str, _df: pd.DataFrame) -> "FeedbackSummary":
+    """Run the feedback agent over the validated upload (cached on the upload's key, not the frame)"""
+    # Initialize the feedback agent
+    config, profile_storage, llm = get_llm_and_storage()
+    
+    # Hand the validated frame to the agent as an in-memory CSV instead of a temp file
+    feedback_agent = FeedbackAgent(
+        config=config,
+        profile_storage=profile_storage,
+        llm=llm,
+        csv_path=io.StringIO(_df.to_csv(index=False))
+    )
+    
+    # Process the data
+    feedback_agent.read_csv()
+    return feedback_agent.generate_feedback()
+
+def format_scores(values, fmt='%.2f'):
+    """Format a whole column of numeric scores as strings in one vectorized call"""
+    return np.char.mod(fmt, np.fromiter(values, dtype=SCORE_DTYPE))
+
+def split_breakdown(breakdown):
+    """Split a {label: score} breakdown into parallel label and score arrays"""
+    labels = np.array(list(breakdown), dtype=object)
+    scores = np.fromiter(breakdown.values(), dtype=SCORE_DTYPE, count=len(breakdown))
+    return labels, scores
+
 def validate_csv_format(df):
     """Validate that the CSV has required columns"""
-    required_columns = ['student_id', 'teacher_id', 'objective', 'question', 'answer']
+    # Check for required columns with set lookups (keeps the required order in the message).
+    # This runs first: parse_csv drops the other columns, so a file with none of the
+    # required headers arrives as a frame with no columns and would otherwise look empty
+    present_columns = set(df.columns)
+    missing_columns = [col for col in REQUIRED_COLUMNS if col not in present_columns]
+    if missing_columns:
+        return False, f"Missing required columns: {', '.join(missing_columns)}"
+    
+    # Check for rows the reader had to drop because their field count was wrong
+    skipped_rows = df.attrs.get('skipped_rows', 0)
+    if skipped_rows:
+        return False, f"Found {skipped_rows} malformed rows whose number of fields does not match the header"
     
     # Check if DataFrame is empty
     if df.empty:
         return False, "CSV file is empty"
     
-    # Check for required columns
-    missing_columns = [col for col in required_columns if col not in df.columns]
-    if missing_columns:
-        return False, f"Missing required columns: {', '.join(missing_columns)}"
+    # Null mask over the required columns as a single ndarray (no frame copy)
+    nulls = df[list(REQUIRED_COLUMNS)].isna().to_numpy()
     
-    # Remove any completely empty rows
-    df_clean = df.dropna(how='all')
+    # Completely empty rows are ignored rather than reported
+    blank_rows = nulls.all(axis=1)
+    valid_records = len(df) - int(blank_rows.sum())
     
     # Check for empty values in required columns
-    empty_rows = df_clean[required_columns].isnull().any(axis=1).sum()
+    empty_rows = int((nulls.any(axis=1) & ~blank_rows).sum())
     if empty_rows > 0:
         return False, f"Found {empty_rows} rows with empty values in required columns"
     
-    # Check for extra columns that might indicate CSV parsing issues
-    extra_columns = [col for col in df.columns if col not in required_columns and not col.startswith('Unnamed')]
-    if extra_columns:
-        st.warning(f"Found additional columns that will be ignored: {', '.join(extra_columns)}")
-    
-    return True, f"CSV format is valid. Found {len(df_clean)} valid records."
+    return True, f"CSV format is valid. Found {valid_records} valid records."
 
+@fragment
 def display_student_summaries(feedback):
     """Display student summaries in a formatted way"""
     st.subheader("📚 Student Performance Summary")
@@ -74,32 +216,54 @@ def display_student_summaries(feedback):
         st.info("No student data available.")
         return
     
+    # Collect the overview columns and the detail entries in a single pass
+    students = []
+    ids, names, averages, totals, trends = [], [], [], [], []
+    for student_id, data in feedback.student_summaries.items():
+        students.append((student_id, data))
+        ids.append(student_id)
+        names.append(data['name'])
+        averages.append(data['average_score'])
+        totals.append(data['total_assessments'])
+        trends.append(data['performance_trend'])
+    averages = np.asarray(averages, dtype=SCORE_DTYPE)
+    formatted_averages = format_scores(averages)
+    
     # Create tabs for different views
     tab1, tab2 = st.tabs(["Overview", "Detailed View"])
     
     with tab1:
-        # Create a summary dataframe
-        summary_data = []
-        for student_id, data in feedback.student_summaries.items():
-            summary_data.append({
-                'Student ID': student_id,
-                'Name': data['name'],
-                'Average Score': f"{data['average_score']:.2f}",
-                'Total Assessments': data['total_assessments'],
-                'Trend': data['performance_trend']
-            })
-        
-        df_summary = pd.DataFrame(summary_data)
-        st.dataframe(df_summary, use_container_width=True)
+        # Create a summary dataframe column by column
+        df_summary = pd.DataFrame({
+            'Student ID': ids,
+            'Name': names,
+            'Average Score': averages,
+            'Total Assessments': totals,
+            'Trend': trends
+        })
+        # Keep the score column numeric (sortable, Arrow-native) and format on display
+        st.dataframe(df_summary.style.format({'Average Score': '{:.2f}'}), use_container_width=True)
     
     with tab2:
-        # Detailed view with expandable sections
-        for student_id, data in feedback.student_summaries.items():
+        # Detailed view with expandable sections, one page of students at a time
+        total_pages = max(1, (len(students) + STUDENTS_PER_PAGE - 1) // STUDENTS_PER_PAGE)
+        page = int(st.number_input(
+            f"Page (1-{total_pages})",
+            min_value=1,
+            max_value=total_pages,
+            value=1,
+            step=1,
+            key="student_detail_page"
+        ))
+        start = (page - 1) * STUDENTS_PER_PAGE
+        end = start + STUDENTS_PER_PAGE
+        
+        for (student_id, data), average in zip(students[start:end], formatted_averages[start:end]):
             with st.expander(f"👤 {data['name']} ({student_id})"):
                 col1, col2, col3 = st.columns(3)
                 
                 with col1:
-                    st.metric("Average Score", f"{data['average_score']:.2f}")
+                    st.metric("Average Score", average)
                 with col2:
                     st.metric("Total Assessments", data['total_assessments'])
                 with col3:
@@ -108,20 +272,16 @@ def display_student_summaries(feedback):
                 # Objective breakdown
                 if data['objective_breakdown']:
                     st.write("**Objective Performance:**")
-                    obj_df = pd.DataFrame([
-                        {'Objective': obj, 'Score': f"{score:.2f}"} 
-                        for obj, score in data['objective_breakdown'].items()
-                    ])
-                    st.dataframe(obj_df, use_container_width=True)
+                    labels, scores = split_breakdown(data['objective_breakdown'])
+                    obj_df = pd.DataFrame({'Objective': labels, 'Score': scores})
+                    st.dataframe(obj_df.style.format({'Score': '{:.2f}'}), use_container_width=True)
                 
                 # Bloom taxonomy breakdown
                 if data['bloom_breakdown']:
                     st.write("**Bloom Taxonomy Performance:**")
-                    bloom_df = pd.DataFrame([
-                        {'Bloom Level': bloom, 'Score': f"{score:.2f}"} 
-                        for bloom, score in data['bloom_breakdown'].items()
-                    ])
-                    st.dataframe(bloom_df, use_container_width=True)
+                    labels, scores = split_breakdown(data['bloom_breakdown'])
+                    bloom_df = pd.DataFrame({'Bloom Level': labels, 'Score': scores})
+                    st.dataframe(bloom_df.style.format({'Score': '{:.2f}'}), use_container_width=True)
                 
                 # Individual assessments
                 if data['assessments']:
@@ -145,6 +305,7 @@ def display_teacher_summaries(feedback):
     for teacher_id, data in feedback.teacher_summaries.items():
         with st.expander(f"🏫 {data['teacher_name']} ({teacher_id})"):
             col1, col2 = st.columns(2)
+            dist = data['score_distribution']
             
             with col1:
                 st.metric("Average Score", f"{data['average_score']:.2f}")
@@ -152,7 +313,6 @@ def display_teacher_summaries(feedback):
             
             with col2:
                 st.write("**Score Distribution:**")
-                dist = data['score_distribution']
                 st.write(f"• Min: {dist['min']:.2f}")
                 st.write(f"• Max: {dist['max']:.2f}")
                 st.write(f"• Median: {dist['median']:.2f}")
@@ -173,30 +333,43 @@ def display_objective_summaries(feedback):
         st.info("No objective data available.")
         return
     
-    # Create a summary table
-    obj_data = []
+    # Create a summary table column by column, keeping the entries for the detailed view
+    entries = []
+    objectives, averages, totals, mastery = [], [], [], []
     for objective, data in feedback.objective_summaries.items():
-        obj_data.append({
-            'Objective': objective,
-            'Average Score': f"{data['average_score']:.2f}",
-            'Total Questions': data['total_questions'],
-            'Mastery %': f"{data['mastery_percentage']:.1f}%"
-        })
+        entries.append((objective, data))
+        objectives.append(objective)
+        averages.append(data['average_score'])
+        totals.append(data['total_questions'])
+        mastery.append(data['mastery_percentage'])
     
-    df_objectives = pd.DataFrame(obj_data)
-    st.dataframe(df_objectives, use_container_width=True)
+    averages = np.asarray(averages, dtype=SCORE_DTYPE)
+    mastery = np.asarray(mastery, dtype=SCORE_DTYPE)
+    formatted_averages = format_scores(averages)
+    formatted_mastery = format_scores(mastery, '%.1f%%')
+    
+    df_objectives = pd.DataFrame({
+        'Objective': objectives,
+        'Average Score': averages,
+        'Total Questions': totals,
+        'Mastery %': mastery
+    })
+    st.dataframe(
+        df_objectives.style.format({'Average Score': '{:.2f}', 'Mastery %': '{:.1f}%'}),
+        use_container_width=True
+    )
     
     # Detailed view
-    for objective, data in feedback.objective_summaries.items():
+    for (objective, data), average, mastery_pct in zip(entries, formatted_averages, formatted_mastery):
         with st.expander(f"📋 {objective}"):
             col1, col2, col3 = st.columns(3)
             
             with col1:
-                st.metric("Average Score", f"{data['average_score']:.2f}")
+                st.metric("Average Score", average)
             with col2:
                 st.metric("Total Questions", data['total_questions'])
             with col3:
-                st.metric("Mastery Percentage", f"{data['mastery_percentage']:.1f}%")
+                st.metric("Mastery Percentage", mastery_pct)
             
             st.info(data['summary'])
 
@@ -208,17 +381,19 @@ def display_learning_gaps(feedback):
         st.success("🎉 No significant learning gaps detected!")
         return
     
-    for objective, gap_data in feedback.learning_gaps.items():
-        st.warning(f"**{objective}**")
-        col1, col2 = st.columns(2)
-        
-        with col1:
-            st.write(f"Average Score: {gap_data['average_score']:.2f}")
-        with col2:
-            st.write(f"Mastery Percentage: {gap_data['mastery_percentage']:.1f}%")
-        
-        st.write(f"💡 **Recommendation:** {gap_data['recommendation']}")
-        st.divider()
+    gaps = feedback.learning_gaps
+    averages = format_scores(gap['average_score'] for gap in gaps.values())
+    mastery = format_scores((gap['mastery_percentage'] for gap in gaps.values()), '%.1f%%')
+    
+    # Render every gap as one markdown block instead of several widgets per gap
+    lines = []
+    for (objective, gap_data), average, mastery_pct in zip(gaps.items(), averages, mastery):
+        lines.append(f"#### ⚠️ {objective}")
+        lines.append(f"- Average Score: {average}")
+        lines.append(f"- Mastery Percentage: {mastery_pct}")
+        lines.append(f"- 💡 **Recommendation:** {gap_data['recommendation']}")
+        lines.append("---")
+    st.markdown("\n".join(lines))
 
 def display_low_performing_students(feedback):
     """Display low-performing students"""
@@ -228,25 +403,27 @@ def display_low_performing_students(feedback):
         st.success("🎉 No low-performing students detected!")
         return
     
-    for student in feedback.low_performing_students:
-        st.warning(f"**{student['name']} ({student['student_id']})**")
+    averages = format_scores(student['average_score'] for student in feedback.low_performing_students)
+    
+    # Render every student as one markdown block instead of several widgets per student
+    lines = []
+    for student, average in zip(feedback.low_performing_students, averages):
+        lines.append(f"#### ⚠️ {student['name']} ({student['student_id']})")
+        lines.append(f"- Average Score: {average}")
         
-        col1, col2 = st.columns(2)
-        with col1:
-            st.write(f"Average Score: {student['average_score']:.2f}")
-        with col2:
-            if student['weak_objectives']:
-                st.write("**Weak Objectives:**")
-                for obj, score in student['weak_objectives'].items():
-                    st.write(f"• {obj}: {score:.2f}")
+        if student['weak_objectives']:
+            lines.append("- **Weak Objectives:**")
+            for obj, score in student['weak_objectives'].items():
+                lines.append(f"    - {obj}: {score:.2f}")
         
         if student['weak_bloom_levels']:
-            st.write("**Weak Bloom Levels:**")
+            lines.append("- **Weak Bloom Levels:**")
             for bloom, score in student['weak_bloom_levels'].items():
-                st.write(f"• {bloom}: {score:.2f}")
+                lines.append(f"    - {bloom}: {score:.2f}")
         
-        st.write(f"💡 **Recommendation:** {student['recommendation']}")
-        st.divider()
+        lines.append(f"- 💡 **Recommendation:** {student['recommendation']}")
+        lines.append("---")
+    st.markdown("\n".join(lines))
 
 def display_misunderstood_concepts(feedback):
     """Display misunderstood concepts"""
@@ -256,12 +433,18 @@ def display_misunderstood_concepts(feedback):
         st.success("🎉 No misunderstood concepts detected!")
         return
     
-    for concept_data in feedback.misunderstood_concepts:
-        st.error(f"**{concept_data['concept']}**")
-        st.write(f"**Question:** {concept_data['question']}")
-        st.write(f"**Average Score:** {concept_data['average_score']:.2f}")
-        st.write(f"💡 **Recommendation:** {concept_data['recommendation']}")
-        st.divider()
+    concepts = feedback.misunderstood_concepts
+    averages = format_scores(concept_data['average_score'] for concept_data in concepts)
+    
+    # Render every concept as one markdown block instead of several widgets per concept
+    lines = []
+    for concept_data, average in zip(concepts, averages):
+        lines.append(f"#### ❗ {concept_data['concept']}")
+        lines.append(f"- **Question:** {concept_data['question']}")
+        lines.append(f"- **Average Score:** {average}")
+        lines.append(f"- 💡 **Recommendation:** {concept_data['recommendation']}")
+        lines.append("---")
+    st.markdown("\n".join(lines))
 
 def main():
     # Main title
@@ -348,20 +531,15 @@ def main():
         
         # Show sample data format
         st.subheader("📋 Sample Data Format")
-        sample_df = pd.read_csv(io.StringIO(create_sample_csv()))
-        st.dataframe(sample_df, use_container_width=True)
+        st.dataframe(create_sample_df(), use_container_width=True)
         
     else:
         try:
             # Read and validate the uploaded file with proper CSV handling
-            df = pd.read_csv(
-                uploaded_file,
-                encoding='utf-8',
-                quotechar='"',
-                escapechar='\\',
-                skipinitialspace=True,
-                on_bad_lines='warn'  # This will warn about bad lines but continue processing
-            )
+            # Key the caches on the upload's id so reruns don't re-hash the whole file
+            file_bytes = uploaded_file.getvalue()
+            file_key = getattr(uploaded_file, 'file_id', None) or hashlib.md5(file_bytes).hexdigest()
+            df = parse_csv(file_key, file_bytes)
             
             # Validate CSV format
             is_valid, message = validate_csv_format(df)
@@ -378,78 +556,48 @@ def main():
             with st.expander("👀 Data Preview", expanded=False):
                 st.dataframe(df, use_container_width=True)
                 st.write(f"**Total Records:** {len(df)}")
-                st.write(f"**Unique Students:** {df['student_id'].nunique()}")
-                st.write(f"**Unique Teachers:** {df['teacher_id'].nunique()}")
-                st.write(f"**Unique Objectives:** {df['objective'].nunique()}")
+                counts = df[['student_id', 'teacher_id', 'objective']].nunique()
+                st.write(f"**Unique Students:** {counts['student_id']}")
+                st.write(f"**Unique Teachers:** {counts['teacher_id']}")
+                st.write(f"**Unique Objectives:** {counts['objective']}")
             
             # Process the file
             with st.spinner("🔄 Processing assessment data..."):
-                # Save uploaded file temporarily
-                with tempfile.NamedTemporaryFile(mode='w', delete=False, suffix='.csv') as tmp_file:
-                    df.to_csv(tmp_file.name, index=False)
-                    tmp_path = tmp_file.name
+                feedback = run_feedback(file_key, df)
+            
+            st.success("✅ Analysis complete!")
+            
+            # Display selected sections
+            if "Overview" in selected_sections:
+                st.header("📈 Overview")
+                col1, col2, col3, col4 = st.columns(4)
                 
-                try:
-                    # Initialize the feedback agent
-                    config = get_config()
-                    profile_storage = ProfileStorage(db_path=config.PROFILE_DB_PATH)
-                    llm = ConfigurableLLM(
-                        config=config,
-                        api_key=config.GROQ_API_KEY,
-                        model=config.LLM_MODEL,
-                        base_url=config.LLM_BASE_URL,
-                        max_tokens=config.MAX_TOKENS
-                    )
-                    
-                    feedback_agent = FeedbackAgent(
-                        config=config,
-                        profile_storage=profile_storage,
-                        llm=llm,
-                        csv_path=tmp_path
-                    )
-                    
-                    # Process the data
-                    feedback_agent.read_csv()
-                    feedback = feedback_agent.generate_feedback()
-                    
-                    st.success("✅ Analysis complete!")
-                    
-                    # Display selected sections
-                    if "Overview" in selected_sections:
-                        st.header("📈 Overview")
-                        col1, col2, col3, col4 = st.columns(4)
-                        
-                        with col1:
-                            st.metric("Total Students", len(feedback.student_summaries))
-                        with col2:
-                            st.metric("Total Teachers", len(feedback.teacher_summaries))
-                        with col3:
-                            st.metric("Learning Gaps", len(feedback.learning_gaps))
-                        with col4:
-                            st.metric("Low Performers", len(feedback.low_performing_students))
-                    
-                    if "Student Performance" in selected_sections:
-                        display_student_summaries(feedback)
-                    
-                    if "Teacher Performance" in selected_sections:
-                        display_teacher_summaries(feedback)
-                    
-                    if "Objective Analysis" in selected_sections:
-                        display_objective_summaries(feedback)
-                    
-                    if "Learning Gaps" in selected_sections:
-                        display_learning_gaps(feedback)
-                    
-                    if "Low Performers" in selected_sections:
-                        display_low_performing_students(feedback)
-                    
-                    if "Misunderstood Concepts" in selected_sections:
-                        display_misunderstood_concepts(feedback)
-                    
-                finally:
-                    # Clean up temporary file
-                    if os.path.exists(tmp_path):
-                        os.unlink(tmp_path)
+                with col1:
+                    st.metric("Total Students", len(feedback.student_summaries))
+                with col2:
+                    st.metric("Total Teachers", len(feedback.teacher_summaries))
+                with col3:
+                    st.metric("Learning Gaps", len(feedback.learning_gaps))
+                with col4:
+                    st.metric("Low Performers", len(feedback.low_performing_students))
+            
+            if "Student Performance" in selected_sections:
+                display_student_summaries(feedback)
+            
+            if "Teacher Performance" in selected_sections:
+                display_teacher_summaries(feedback)
+            
+            if "Objective Analysis" in selected_sections:
+                display_objective_summaries(feedback)
+            
+            if "Learning Gaps" in selected_sections:
+                display_learning_gaps(feedback)
+            
+            if "Low Performers" in selected_sections:
+                display_low_performing_students(feedback)
+            
+            if "Misunderstood Concepts" in selected_sections:
+                display_misunderstood_concepts(feedback)
                         
         except Exception as e:
             st.error(f"❌ An error occurred while processing the file: {str(e)}")
@@ -617,7 +617,7 @@ class AssessmentAgent:
         return gaps
 
 class ContentSourcingAgent:
-    def __init__(self, config: AgentConfig, api_key: Optional[str] = None, model: str = "", base_url: str = "", max_tokens: int = None):
+    def __init__(self, config: AgentConfig, api_key: Optional[str] = None, model: str = "", base_url: str = "", max_tokens: int = None, llm: Optional[ConfigurableLLM] = None):
         self.content_api = ContentAPI()
         self.text_splitter = RecursiveCharacterTextSplitter(
             chunk_size=config.CONTENT_CHUNK_SIZE,
@@ -630,7 +630,8 @@ class ContentSourcingAgent:
         self.assessments: List[AssessmentItem] = []
         
         try:
-            self.llm = ConfigurableLLM(
+            # Reuse a prebuilt (stateless) LLM client when one is passed in
+            self.llm = llm or ConfigurableLLM(
                 config=config,
                 api_key=api_key,
                 model=model or self.config.LLM_MODEL,
@@ -1,62 +1,171 @@
 import os
-import requests
-import PyPDF2
+import re
+import requests_cache
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+import pypdfium2 as pdfium
 import uuid
+import hashlib
 import logging
-import json
+import orjson
+import queue
+import threading
+import multiprocessing
+import atexit
 from datetime import datetime
 from dotenv import load_dotenv
-from bs4 import BeautifulSoup
-from langchain_groq import ChatGroq
-from langchain_core.prompts import ChatPromptTemplate
+from selectolax.parser import HTMLParser
 import warnings
+from typing import Optional
+from functools import lru_cache
 from urllib.parse import urlparse, urljoin
+from concurrent.futures import ThreadPoolExecutor, ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
 
 # Suppress DeprecationWarning
 warnings.filterwarnings("ignore", category=DeprecationWarning)
 
-# Load environment variables
-load_dotenv()
+# Logging setup (basicConfig and load_dotenv run in main(): the extraction pool
+# spawns workers that re-import this module, so import must have no side effects)
+logger = logging.getLogger(__name__)
 
-# Environment variables
-GROQ_API_KEY = os.getenv("GROQ_API_KEY")
-if not GROQ_API_KEY:
-    raise ValueError("GROQ_API_KEY environment variable is not set")
+# Shared HTTP session so every request reuses pooled keep-alive connections.
+# Successful GET/HEAD responses are cached on disk for a day so repeated runs over
+# the same sources skip the network; PDF bodies (GETs) are left out of the cache
+# since they are streamed straight to disk by download_pdf, but HEADs for PDFs
+# (is_valid_pdf) carry no body and are cached
+USER_AGENT = "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/127.0.0.0 Safari/537.36"
+HTTP_CACHE_FILE = "http_cache.sqlite"
+HTTP_CACHE_EXPIRE_SECONDS = 24 * 60 * 60
+_session = None
+_session_lock = threading.Lock()
 
-# Logging setup
-logging.basicConfig(level=logging.INFO)
-logger = logging.getLogger(__name__)
+def get_session() -> requests_cache.CachedSession:
+    """Return the shared cached HTTP session, opening it on first use."""
+    global _session
+    with _session_lock:
+        if _session is None:
+            session = requests_cache.CachedSession(
+                HTTP_CACHE_FILE,
+                expire_after=HTTP_CACHE_EXPIRE_SECONDS,
+                allowable_methods=("GET", "HEAD"),
+                filter_fn=lambda response: (
+                    response.request.method == "HEAD"
+                    or "application/pdf" not in response.headers.get("Content-Type", "").lower()
+                )
+            )
+            session.headers.update({"User-Agent": USER_AGENT})
+            adapter = HTTPAdapter(
+                pool_connections=20,
+                pool_maxsize=20,
+                max_retries=Retry(total=3, backoff_factor=0.3, status_forcelist=[429, 500, 502, 503, 504])
+            )
+            session.mount("https://", adapter)
+            session.mount("http://", adapter)
+            _session = session
+        return _session
+
+# Direct PDF URLs used for source domains whose pages expose no PDF links
+# without JavaScript, keyed by domain (subdomains such as www. also match)
+FALLBACK_PDFS = {
+    "ck12.org": ["https://assets.openstax.org/oscms-prodcms/media/documents/AlgebraandTrigonometry-OP.pdf"]
+}
+
+# Maximum number of PDF links taken from a single scraped page
+MAX_PDF_LINKS = 10
 
-# JSON file for audit logs
-AUDIT_LOG_FILE = "audit_logs.json"
+# Number of PDFs downloaded and extracted concurrently per source URL
+MAX_DOWNLOAD_WORKERS = 10
+
+# Chunk size used when streaming PDF downloads to disk
+DOWNLOAD_CHUNK_SIZE = 64 * 1024
+
+# PDFs with at least this many pages have their text extracted across
+# EXTRACT_WORKERS processes (PDF parsing is CPU-bound)
+PARALLEL_EXTRACT_MIN_PAGES = 32
+EXTRACT_WORKERS = os.cpu_count() or 1
+_extract_pool = None
+_extract_pool_lock = threading.Lock()
+
+# PDFium is not thread-safe, even across separate documents, so every pdfium
+# call made in this process (the download threads) is serialized on this lock;
+# the pool workers are separate processes and do not need it
+_pdfium_lock = threading.Lock()
+
+# JSON Lines file for audit logs (one JSON object per line, append-only)
+AUDIT_LOG_FILE = "audit_logs.jsonl"
+
+# Audit entries are written by a background thread in batches of up to
+# AUDIT_BATCH_SIZE, with an fsync every AUDIT_FSYNC_EVERY batches
+AUDIT_BATCH_SIZE = 128
+AUDIT_FSYNC_EVERY = 8
 
 def init_audit_log_file():
-    """Initialize the audit log JSON file if it doesn't exist."""
+    """Initialize the audit log JSONL file if it doesn't exist."""
     if not os.path.exists(AUDIT_LOG_FILE):
-        with open(AUDIT_LOG_FILE, "w") as f:
-            json.dump([], f)
+        open(AUDIT_LOG_FILE, "a").close()
+
+def _drain_audit_queue():
+    """Background writer: batch queued audit entries into a single append per batch."""
+    batches_written = 0
+    while True:
+        batch = [_audit_queue.get()]
+        while len(batch) < AUDIT_BATCH_SIZE:
+            try:
+                batch.append(_audit_queue.get(timeout=0.1))
+            except queue.Empty:
+                break
+        try:
+            with open(AUDIT_LOG_FILE, "ab") as f:
+                f.writelines(orjson.dumps(entry) + b"\n" for entry in batch)
+                batches_written += 1
+                if batches_written % AUDIT_FSYNC_EVERY == 0:
+                    f.flush()
+                    os.fsync(f.fileno())
+            logger.info(f"Logged {len(batch)} audit entries to {AUDIT_LOG_FILE}")
+        except Exception as e:
+            logger.error(f"Failed to write {len(batch)} audit entries to {AUDIT_LOG_FILE}: {str(e)}")
+        finally:
+            for _ in batch:
+                _audit_queue.task_done()
+
+def _start_audit_writer():
+    """Start the background audit writer thread on first use."""
+    global _audit_writer
+    with _audit_writer_lock:
+        if _audit_writer is None:
+            _audit_writer = threading.Thread(target=_drain_audit_queue, name="audit-log-writer", daemon=True)
+            _audit_writer.start()
+            atexit.register(flush_audit_log)
+
+def flush_audit_log():
+    """Block until every queued audit entry has been written."""
+    _audit_queue.join()
 
 def append_audit_log(log_entry: dict):
-    """Append an audit log entry to the JSON file."""
+    """Queue an audit log entry for the background JSONL writer."""
+    _start_audit_writer()
+    _audit_queue.put(log_entry)
+
+def read_audit_logs():
+    """Yield audit log entries from the JSONL file in the order they were written."""
+    flush_audit_log()
     try:
-        with open(AUDIT_LOG_FILE, "r") as f:
-            logs = json.load(f)
-    except (FileNotFoundError, json.JSONDecodeError):
-        logs = []
-    
-    logs.append(log_entry)
-    with open(AUDIT_LOG_FILE, "w") as f:
-        json.dump(logs, f, indent=2)
-    logger.info(f"Logged audit entry to {AUDIT_LOG_FILE}")
+        with open(AUDIT_LOG_FILE, "rb") as f:
+            for line in f:
+                if line.strip():
+                    yield orjson.loads(line)
+    except FileNotFoundError:
+        return
+
+_audit_queue = queue.Queue()
+_audit_writer = None
+_audit_writer_lock = threading.Lock()
 
 def is_valid_pdf(url: str) -> bool:
     """Validate if a URL points to a valid PDF."""
     try:
-        headers = {
-            "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/127.0.0.0 Safari/537.36",
-            "Accept": "application/pdf"
-        }
-        response = requests.head(url, headers=headers, timeout=5, allow_redirects=True)
+        response = get_session().head(url, headers={"Accept": "application/pdf"}, timeout=5, allow_redirects=True)
         if response.status_code != 200:
             return False
         content_type = response.headers.get("Content-Type", "").lower()
@@ -79,135 +188,204 @@ def validate_url(url: str) -> str:
         logger.error(f"Invalid URL {url}: {str(e)}")
         return ""
 
+@lru_cache(maxsize=256)
+def _fetch_wikipedia_extract(title: str) -> str:
+    """Fetch the plain-text extract of a Wikipedia article (memoized per title)."""
+    api_url = "https://en.wikipedia.org/w/api.php"
+    params = {
+        "action": "query",
+        "format": "json",
+        "titles": title,
+        "prop": "extracts",
+        "explaintext": True
+    }
+    response = get_session().get(api_url, params=params)
+    response.raise_for_status()
+    data = response.json()
+    page = next(iter(data["query"]["pages"].values()))
+    return page.get("extract", "")
+
 def scrape_wikipedia_text(url: str) -> str:
     """Scrape text content from a Wikipedia page using the API."""
     try:
         title = url.split("/wiki/")[-1]
-        api_url = "https://en.wikipedia.org/w/api.php"
-        params = {
-            "action": "query",
-            "format": "json",
-            "titles": title,
-            "prop": "extracts",
-            "explaintext": True
-        }
-        headers = {"User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64)"}
-        response = requests.get(api_url, params=params, headers=headers)
-        response.raise_for_status()
-        data = response.json()
-        page = next(iter(data["query"]["pages"].values()))
-        return page.get("extract", "")
+        return _fetch_wikipedia_extract(title)
     except Exception as e:
         logger.error(f"Error scraping Wikipedia text {url}: {str(e)}")
         return ""
 
 def scrape_pdf_links(url: str, subject: str = "algebra") -> list:
-    """Scrape PDF links from a URL using requests and BeautifulSoup, filtering by subject."""
+    """Scrape PDF links from a URL using requests and selectolax, filtering by subject."""
     try:
         url = validate_url(url)
         if not url:
             return []
-        headers = {
-            "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/127.0.0.0 Safari/537.36",
-            "Accept": "text/html,application/xhtml+xml,application/xml;q=0.9,image/webp,*/*;q=0.8"
-        }
-        response = requests.get(url, headers=headers, timeout=10)
+        headers = {"Accept": "text/html,application/xhtml+xml,application/xml;q=0.9,image/webp,*/*;q=0.8"}
+        response = get_session().get(url, headers=headers, timeout=10)
         response.raise_for_status()
         
-        # Parse HTML with BeautifulSoup
-        soup = BeautifulSoup(response.text, "html.parser")
-        pdf_links = [a["href"] for a in soup.find_all("a", href=True) if a["href"].endswith(".pdf")]
+        # Select the .pdf anchors directly with selectolax's C (Lexbor) HTML parser
+        tree = HTMLParser(response.text)
+        pdf_links = [a.attributes.get("href", "") for a in tree.css("a[href$='.pdf']")]
         
         # Log snippet of HTML for debugging
-        logger.debug(f"HTML snippet from {url}: {str(soup)[:500]}")
+        logger.debug(f"HTML snippet from {url}: {response.text[:500]}")
         
-        # Filter for algebra-related PDFs
-        filtered_links = [link for link in pdf_links if subject.lower() in link.lower() or "math" in link.lower()]
-        if not filtered_links:
-            filtered_links = pdf_links  # Fallback to all PDFs if no subject-specific ones
+        # Filter for subject-related PDFs in one case-insensitive regex pass
+        subject_pattern = re.compile(rf"(?i)(?:{re.escape(subject)}|math)")
+        filtered_links = list(filter(subject_pattern.search, pdf_links)) or pdf_links  # Fallback to all PDFs if no subject-specific ones
         
-        # Ensure absolute URLs and validate
-        valid_links = []
-        for link in filtered_links:
-            absolute_url = urljoin(url, link)
-            if is_valid_pdf(absolute_url) and "web.archive.org" not in absolute_url:
-                valid_links.append(absolute_url)
+        # Ensure absolute URLs and de-duplicate (keeping page order) before capping, so
+        # a PDF linked many times is only fetched once; the Content-Type is checked
+        # when each PDF is downloaded, so no separate HEAD request is made per link here
+        absolute_links = dict.fromkeys(urljoin(url, link) for link in filtered_links)
+        valid_links = [link for link in absolute_links if "web.archive.org" not in link][:MAX_PDF_LINKS]
         
         if not valid_links:
             logger.warning(f"No valid PDF links found on {url}")
             return []
         
-        logger.info(f"Found {len(valid_links)} valid PDF links on {url}: {valid_links}")
-        return list(set(valid_links))[:10]  # Limit to 10 URLs
+        logger.info(f"Found {len(valid_links)} candidate PDF links on {url}: {valid_links}")
+        return valid_links
     except Exception as e:
         logger.error(f"Error scraping {url}: {str(e)}")
         return []
 
 def format_pdf_links(pdf_links: list) -> str:
-    """Format PDF links as JSON using Groq LLM with retry logic."""
-    max_retries = 3
-    for attempt in range(max_retries):
-        try:
-            llm = ChatGroq(
-                model="llama3-8b-8192",
-                api_key=GROQ_API_KEY,
-                temperature=0.5,
-                max_tokens=4000
-            )
-            prompt = ChatPromptTemplate.from_template(
-                "Convert the following list of PDF URLs into a JSON list of objects with 'url' keys: {urls}. "
-                "Return only valid JSON, e.g., [{\"url\": \"https://example.com/sample.pdf\"}]."
-            )
-            response = llm.invoke(prompt.format(urls=json.dumps(pdf_links)))
-            json_output = response.content.strip()
-            
-            # Validate JSON
-            json.loads(json_output)
-            logger.info("Successfully formatted PDF links as JSON")
-            return json_output
-        except json.JSONDecodeError as e:
-            logger.error(f"Invalid JSON from LLM (attempt {attempt + 1}/{max_retries}): {json_output}, error: {str(e)}")
-        except Exception as e:
-            logger.error(f"LLM formatting error (attempt {attempt + 1}/{max_retries}): {str(e)}")
-    logger.warning("Falling back to basic JSON formatting after LLM retries")
-    return json.dumps([{"url": url} for url in pdf_links])
+    """Format PDF links as a JSON list of {"url": ...} objects."""
+    return orjson.dumps([{"url": url} for url in pdf_links]).decode()
 
 def download_pdf(url: str, local_dir: str = "./pdfs") -> tuple[str, str]:
-    """Download a PDF from a URL and save it locally."""
+    """Download a PDF from a URL and save it locally, reusing an earlier download."""
     try:
-        headers = {
-            "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/127.0.0.0 Safari/537.36",
-            "Accept": "application/pdf"
-        }
-        response = requests.get(url, headers=headers, stream=True, timeout=10)
+        # Name the file after a hash of its URL so re-runs find and reuse it
+        filename = hashlib.blake2b(url.encode(), digest_size=16).hexdigest() + ".pdf"
+        local_path = os.path.join(local_dir, filename)
+        if os.path.exists(local_path) and os.path.getsize(local_path) > 0:
+            logger.info(f"Using cached PDF {local_path} for {url}")
+            return local_path, filename
+
+        response = get_session().get(url, headers={"Accept": "application/pdf"}, stream=True, timeout=10)
         response.raise_for_status()
-        filename = f"{uuid.uuid4()}.pdf"
+        content_type = response.headers.get("Content-Type", "").lower()
+        if "application/pdf" not in content_type:
+            response.close()
+            raise ValueError(f"Not a PDF (Content-Type: {content_type or 'missing'})")
         os.makedirs(local_dir, exist_ok=True)
-        local_path = os.path.join(local_dir, filename)
-        with open(local_path, "wb") as f:
-            f.write(response.content)
+        # Write to a temporary name and rename when complete, so an interrupted
+        # download is never mistaken for a cached PDF
+        part_path = local_path + ".part"
+        try:
+            with open(part_path, "wb") as f:
+                # Stream to disk in chunks rather than buffering the whole PDF in memory
+                for chunk in response.iter_content(chunk_size=DOWNLOAD_CHUNK_SIZE):
+                    if chunk:
+                        f.write(chunk)
+            os.replace(part_path, local_path)
+        except Exception:
+            # Don't leave a partial file behind
+            if os.path.exists(part_path):
+                os.remove(part_path)
+            raise
         logger.info(f"Downloaded PDF to {local_path}")
         return local_path, filename
     except Exception as e:
         logger.error(f"Failed to download PDF from {url}: {str(e)}")
         raise
 
+def _extract_page_range(pdf_path: str, start: int, stop: int) -> str:
+    """Extract the text of pages [start, stop) of a PDF file."""
+    pdf = pdfium.PdfDocument(pdf_path)
+    try:
+        page_texts = []
+        for index in range(start, stop):
+            page = pdf[index]
+            textpage = page.get_textpage()
+            page_texts.append(textpage.get_text_range())
+            textpage.close()
+            page.close()
+        return "".join(page_texts)
+    finally:
+        pdf.close()
+
+def _get_extract_pool() -> ProcessPoolExecutor:
+    """Return the shared process pool used for page extraction, creating it on first use."""
+    global _extract_pool
+    with _extract_pool_lock:
+        if _extract_pool is None:
+            # Spawn rather than fork: the pool is created from a download thread while
+            # other threads (and the locks they hold) are live in this process
+            _extract_pool = ProcessPoolExecutor(
+                max_workers=EXTRACT_WORKERS,
+                mp_context=multiprocessing.get_context("spawn")
+            )
+        return _extract_pool
+
+def _discard_extract_pool(pool: ProcessPoolExecutor):
+    """Drop a broken process pool so the next extraction starts a fresh one."""
+    global _extract_pool
+    with _extract_pool_lock:
+        if _extract_pool is pool:
+            _extract_pool = None
+    pool.shutdown(wait=False, cancel_futures=True)
+
+def _extract_in_pool(pdf_path: str, starts: list, stops: list) -> str:
+    """Extract page ranges in the process pool, retrying once on a fresh pool if a worker died."""
+    for attempt in range(2):
+        pool = _get_extract_pool()
+        try:
+            return "".join(pool.map(_extract_page_range, [pdf_path] * len(starts), starts, stops))
+        except BrokenProcessPool:
+            # A worker crashed (e.g. PDFium on a malformed PDF); without this the
+            # cached pool would stay broken for every later PDF in the run
+            logger.warning(f"Extraction worker died while processing {pdf_path}, restarting the pool")
+            _discard_extract_pool(pool)
+            if attempt == 1:
+                raise
+
 def extract_pdf_text(pdf_path: str) -> str:
     """Extract text from a PDF file."""
     try:
-        with open(pdf_path, "rb") as file:
-            reader = PyPDF2.PdfReader(file)
-            text = ""
-            for page in reader.pages:
-                page_text = page.extract_text()
-                if page_text:
-                    text += page_text
+        with _pdfium_lock:
+            pdf = pdfium.PdfDocument(pdf_path)
+            try:
+                page_count = len(pdf)
+            finally:
+                pdf.close()
+
+        if page_count < PARALLEL_EXTRACT_MIN_PAGES or EXTRACT_WORKERS == 1:
+            with _pdfium_lock:
+                text = _extract_page_range(pdf_path, 0, page_count)
+        else:
+            # Split the pages into one contiguous range per worker; each worker
+            # opens the file itself and the ranges are joined back in order
+            step = -(-page_count // EXTRACT_WORKERS)
+            starts = list(range(0, page_count, step))
+            stops = [min(start + step, page_count) for start in starts]
+            text = _extract_in_pool(pdf_path, starts, stops)
         logger.info(f"Extracted text from {pdf_path}")
         return text
     except Exception as e:
         logger.error(f"Failed to extract text from {pdf_path}: {str(e)}")
         raise
 
+def fetch_pdf(url: str) -> Optional[tuple[str, str, str]]:
+    """Download a PDF and extract its text, returning None if either step fails."""
+    try:
+        local_path, filename = download_pdf(url)
+        return local_path, filename, extract_pdf_text(local_path)
+    except Exception as e:
+        logger.error(f"Failed to process PDF {url}: {str(e)}")
+        return None
+
+def get_fallback_pdfs(url: str) -> list[str]:
+    """Return the configured fallback PDF URLs for the domain of a source URL."""
+    domain = urlparse(url).netloc.lower()
+    for fallback_domain, pdf_urls in FALLBACK_PDFS.items():
+        if domain == fallback_domain or domain.endswith("." + fallback_domain):
+            return pdf_urls
+    return []
+
 def source_pdf_content(curriculum_id: int, subject: str, source_urls: list) -> list[dict]:
     """Source and scrape PDF or text content from approved URLs."""
     try:
@@ -254,20 +432,12 @@ def source_pdf_content(curriculum_id: int, subject: str, source_urls: list) -> l
                     pdf_links = []
             else:
                 pdf_links = scrape_pdf_links(url, subject)
-                if not pdf_links and "ck12.org" in url:
-                    logger.info(f"CK-12 page may require JavaScript. Please provide a direct PDF URL.")
-                    print("Suggested URL: https://assets.openstax.org/oscms-prodcms/media/documents/AlgebraandTrigonometry-OP.pdf")
-                    manual_url = input("Enter a direct PDF URL (or press Enter to skip): ").strip()
-                    if manual_url and manual_url.endswith(".pdf"):
-                        manual_url = validate_url(manual_url)
-                        if is_valid_pdf(manual_url):
-                            pdf_links = [{"url": manual_url}]
-                        else:
-                            logger.warning(f"Manual URL {manual_url} is inaccessible")
-                            continue
-                    else:
-                        logger.info("No manual URL provided, skipping CK-12 source")
-                        continue
+                if not pdf_links:
+                    # Pages that render their PDF links with JavaScript (e.g. CK-12)
+                    # fall back to known direct PDFs for that domain
+                    pdf_links = [{"url": u} for u in get_fallback_pdfs(url)]
+                    if pdf_links:
+                        logger.info(f"Using {len(pdf_links)} fallback PDF(s) for {url}")
 
             if not pdf_links:
                 logger.warning(f"No PDF links found for {url}")
@@ -275,27 +445,31 @@ def source_pdf_content(curriculum_id: int, subject: str, source_urls: list) -> l
 
             pdf_links_json = format_pdf_links([link["url"] if isinstance(link, dict) else link for link in pdf_links])
             try:
-                pdf_links = json.loads(pdf_links_json)
-            except json.JSONDecodeError as e:
+                pdf_links = orjson.loads(pdf_links_json)
+            except orjson.JSONDecodeError as e:
                 logger.error(f"Failed to parse pdf_links as JSON for {url}: {str(e)}")
                 continue
 
             if not isinstance(pdf_links, list):
                 pdf_links = [pdf_links]
 
+            pdf_urls = []
             for item in pdf_links:
                 pdf_url = item.get("url") if isinstance(item, dict) else item
                 if not pdf_url or not isinstance(pdf_url, str) or not pdf_url.endswith(".pdf"):
                     logger.warning(f"Skipping invalid or non-PDF URL: {pdf_url}")
                     continue
+                pdf_urls.append(pdf_url)
 
-                fragment_id = str(uuid.uuid4())
-                try:
-                    local_path, filename = download_pdf(pdf_url)
-                    pdf_text = extract_pdf_text(local_path)
-                except Exception as e:
-                    logger.error(f"Failed to process PDF {pdf_url}: {str(e)}")
+            # Download and extract concurrently; results come back in input order
+            with ThreadPoolExecutor(max_workers=MAX_DOWNLOAD_WORKERS) as executor:
+                results = list(executor.map(fetch_pdf, pdf_urls))
+
+            for pdf_url, result in zip(pdf_urls, results):
+                if result is None:
                     continue
+                local_path, filename, pdf_text = result
+                fragment_id = str(uuid.uuid4())
 
                 audit_log = {
                     "id": len(scraped_data) + 1,
@@ -327,6 +501,9 @@ def source_pdf_content(curriculum_id: int, subject: str, source_urls: list) -> l
         raise
 
 def main():
+    # Load environment variables and configure logging
+    load_dotenv()
+    logging.basicConfig(level=logging.INFO)
     print("PDF Content Sourcing Agent")
     try:
         curriculum_id = int(input("Enter Curriculum ID (e.g., 1): "))
@@ -335,8 +512,8 @@ def main():
         source_urls = [url.strip() for url in source_urls]
 
         fragments = source_pdf_content(curriculum_id, subject, source_urls)
-        with open("pdf_data.json", "w") as f:
-            json.dump(fragments, f, indent=2)
+        with open("pdf_data.json", "wb") as f:
+            f.write(orjson.dumps(fragments, option=orjson.OPT_INDENT_2))
         for f in fragments:
             if "pdf_url" in f:
                 print(f"Fragment ID: {f['fragment_id']}, PDF URL: {f['pdf_url']}, Local Path: {f['local_path']}")
@@ -4,7 +4,7 @@ Streamlit UI for Content Sourcing Agent
 """
 
 import streamlit as st
-from agant_updated_assement import ContentSourcingAgent, get_config
+from agant_updated_assement import ContentSourcingAgent, ConfigurableLLM, get_config
 from datetime import datetime
 import os
 from dotenv import load_dotenv
@@ -15,6 +15,96 @@ load_dotenv()
 # Set page configuration
 st.set_page_config(page_title="Content Sourcing Agent Dashboard", layout="wide")
 
+# Seconds a fetched student/teacher report is reused across reruns
+REPORT_CACHE_TTL = 300
+
+@st.cache_resource
+def get_cached_config():
+    """Build the agent configuration once per server process."""
+    return get_config()
+
+@st.cache_resource
+def get_llm():
+    """Build the (stateless) Groq LLM client once per server process."""
+    config = get_cached_config()
+    try:
+        return ConfigurableLLM(
+            config=config,
+            api_key=config.GROQ_API_KEY,
+            model=config.LLM_MODEL,
+            base_url=config.LLM_BASE_URL,
+            max_tokens=config.MAX_TOKENS
+        )
+    except ValueError:
+        return None  # The agent retries and falls back to rule-based processing
+
+def create_agent():
+    """Create a ContentSourcingAgent around the shared config and LLM client."""
+    config = get_cached_config()
+    return ContentSourcingAgent(
+        config=config,
+        api_key=config.GROQ_API_KEY,
+        model=config.LLM_MODEL,
+        base_url=config.LLM_BASE_URL,
+        max_tokens=config.MAX_TOKENS,
+        llm=get_llm()
+    )
+
+@st.cache_data(ttl=REPORT_CACHE_TTL)
+def fetch_student_report(_agent, student_id):
+    """Fetch a student report (the agent is excluded from the cache key)."""
+    if not hasattr(_agent, 'get_student_report'):
+        return {"error": "Student report method not available"}
+    return _agent.get_student_report(student_id)
+
+@st.cache_data(ttl=REPORT_CACHE_TTL)
+def fetch_teacher_report(_agent, teacher_id):
+    """Fetch a teacher report (the agent is excluded from the cache key)."""
+    if not hasattr(_agent, 'get_teacher_report'):
+        return {"error": "Teacher report method not available"}
+    return _agent.get_teacher_report(teacher_id)
+
+def content_sourcing_view(agent):
+    """Render the fetched, processed and stored content held by the agent."""
+    st.header("Content Sourcing Output")
+    if not st.session_state.get('assessments'):  # Check if agent has run
+        st.write("No content sourcing data available. Run the agent to fetch and process content.")
+        return
+
+    # Read the storage once; both listings and the summary reuse it
+    storage = agent.content_api.storage
+    items = list(storage.values())
+    n = len(storage)
+
+    st.subheader("Raw Content Fetched")
+    for item in items:
+        st.write(f"**Title:** {item['title']}")
+        st.write(f"**Content Snippet:** {item['content'][:200]}... (Source: {item['source_url']})")
+        st.write("---")
+
+    st.subheader("Processed Content Items")
+    for item in items:
+        st.write(f"**ID:** {item['id']}")
+        st.write(f"**Title:** {item['title']}")
+        st.write(f"**Category:** {item['category']}")
+        st.write(f"**Tags:** {', '.join(item['tags'])}")
+        st.write(f"**Quality Score:** {item['quality_score']}")
+        st.write(f"**Bloom Level:** {item['bloom_level']}")
+        st.write("---")
+
+    st.subheader("Stored Content IDs")
+    st.write(f"**Total Stored Items:** {n}")
+    st.write(f"**IDs:** {', '.join(storage)}")
+
+    st.subheader("Errors Encountered")
+    errors = st.session_state.get('errors', [])
+    if errors:
+        st.write(f"**Total Errors:** {len(errors)}")
+        for error in errors:
+            st.error(error)
+    else:
+        st.success("No errors encountered during content sourcing.")
+
 # Title and timestamp
 st.title("Content Sourcing Agent Dashboard")
 st.write("Last updated: " + datetime.now().strftime("%Y-%m-%d %H:%M:%S IST"))
@@ -23,20 +113,12 @@ st.write("Last updated: " + datetime.now().strftime("%Y-%m-%d %H:%M:%S IST"))
 st.sidebar.header("Dashboard Controls")
 selected_view = st.sidebar.selectbox("Select View", ["Overview", "Assessments", "Student Report", "Teacher Report", "Content Sourcing"])
 query = st.sidebar.text_input("Enter Query", value=os.getenv('TEST_QUERY', 'artificial intelligence in automotive systems'))
-sources_input = st.sidebar.text_area("Enter Sources (comma-separated URLs)", value=",".join(get_config().STATIC_SOURCES))
+sources_input = st.sidebar.text_area("Enter Sources (comma-separated URLs)", value=",".join(get_cached_config().STATIC_SOURCES))
 sources = [url.strip() for url in sources_input.split(',') if url.strip()]
 
-# Initialize or reuse agent
+# Initialize or reuse agent (one per session: run() replaces its assessments)
 if 'agent' not in st.session_state:
-    config = get_config()
-    agent = ContentSourcingAgent(
-        config=config,
-        api_key=config.GROQ_API_KEY,
-        model=config.LLM_MODEL,
-        base_url=config.LLM_BASE_URL,
-        max_tokens=config.MAX_TOKENS
-    )
-    st.session_state.agent = agent
+    st.session_state.agent = create_agent()
 
 agent = st.session_state.agent
 
@@ -171,6 +253,9 @@ elif selected_view == "Assessments":
                 if st.button(f"Submit Answer for Assessment {i}", key=f"submit_{i}"):
                     response = agent.submit_assessment(i-1, user_answer, student_id, teacher_id)
                     if "error" not in response:
+                        # New scores change the profiles, so drop cached reports
+                        fetch_student_report.clear()
+                        fetch_teacher_report.clear()
                         st.success(f"Submitted! Score: {response['score']:.2f}, Feedback: {response['feedback']}")
                     else:
                         st.error(response["error"])
@@ -180,7 +265,7 @@ elif selected_view == "Assessments":
 elif selected_view == "Student Report":
     st.header("Student Report")
     student_id = st.text_input("Enter Student ID", value=os.getenv('STUDENT_ID', 'student_001'))
-    student_report = agent.get_student_report(student_id) if hasattr(agent, 'get_student_report') else {"error": "Student report method not available"}
+    student_report = fetch_student_report(agent, student_id)
     if "error" not in student_report:
         st.write(f"**Student ID:** {student_report['student_id']}")
         st.write(f"**Name:** {student_report['name']}")
@@ -197,7 +282,7 @@ elif selected_view == "Student Report":
 elif selected_view == "Teacher Report":
     st.header("Teacher Report")
     teacher_id = st.text_input("Enter Teacher ID", value=os.getenv('TEACHER_ID', 'teacher_001'))
-    teacher_report = agent.get_teacher_report(teacher_id) if hasattr(agent, 'get_teacher_report') else {"error": "Teacher report method not available"}
+    teacher_report = fetch_teacher_report(agent, teacher_id)
     if "error" not in teacher_report:
         st.write(f"**Teacher ID:** {teacher_report['teacher_id']}")
         st.write(f"**Name:** {teacher_report['name']}")
@@ -208,40 +293,7 @@ elif selected_view == "Teacher Report":
         st.error(teacher_report["error"])
 
 elif selected_view == "Content Sourcing":
-    st.header("Content Sourcing Output")
-    if st.session_state.get('assessments'):  # Check if agent has run
-        # Simulate accessing the agent's internal state (adjust based on actual state access)
-        st.subheader("Raw Content Fetched")
-        for item in st.session_state.agent.content_api.storage.values():
-            st.write(f"**Title:** {item['title']}")
-            st.write(f"**Content Snippet:** {item['content'][:200]}... (Source: {item['source_url']})")
-            st.write("---")
-
-        st.subheader("Processed Content Items")
-        for item in st.session_state.agent.content_api.storage.values():
-            st.write(f"**ID:** {item['id']}")
-            st.write(f"**Title:** {item['title']}")
-            st.write(f"**Category:** {item['category']}")
-            st.write(f"**Tags:** {', '.join(item['tags'])}")
-            st.write(f"**Quality Score:** {item['quality_score']}")
-            st.write(f"**Bloom Level:** {item['bloom_level']}")
-            st.write("---")
-
-        st.subheader("Stored Content IDs")
-        stored_ids = st.session_state.agent.content_api.storage.keys()
-        st.write(f"**Total Stored Items:** {len(stored_ids)}")
-        st.write(f"**IDs:** {', '.join(stored_ids)}")
-
-        st.subheader("Errors Encountered")
-        errors = st.session_state.get('errors', [])
-        if errors:
-            st.write(f"**Total Errors:** {len(errors)}")
-            for error in errors:
-                st.error(error)
-        else:
-            st.success("No errors encountered during content sourcing.")
-    else:
-        st.write("No content sourcing data available. Run the agent to fetch and process content.")
+    content_sourcing_view(agent)
 
 # Add a footer
 st.sidebar.text("Powered by xAI Grok 3")